@@ -14,6 +14,7 @@ Reference:
 
 from __future__ import annotations
 
+import logging
 from typing import TYPE_CHECKING
 
 import numpy as np
@@ -29,6 +30,8 @@ from .pink_kinematics_configuration import PinkKinematicsConfiguration
 if TYPE_CHECKING:
     from .pink_ik_cfg import PinkIKControllerCfg
 
+logger = logging.getLogger(__name__)
+
 
 class PinkIKController:
     """Integration of Pink IK controller with Isaac Lab.
@@ -229,9 +232,10 @@ class PinkIKController:
         except (AssertionError, Exception) as e:
             # Print warning and return the current joint positions as the target
             if self.cfg.show_ik_warnings:
-                print(
-                    "Warning: IK quadratic solver could not find a solution! Did not update the target joint"
-                    f" positions.\nError: {e}"
+                logger.warning(
+                    "IK quadratic solver could not find a solution! Did not update the target joint positions."
+                    "\nError: %s",
+                    e,
                 )
 
             if self.cfg.xr_enabled:
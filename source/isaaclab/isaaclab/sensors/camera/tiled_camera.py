@@ -272,17 +272,13 @@ class TiledCamera(Camera):
                 dim=(self._view.count, self.cfg.height, self.cfg.width),
                 inputs=[
                     tiled_data_buffer.flatten(),
-                    wp.from_torch(self._data.output[data_type]),  # zero-copy alias
+                    self._output_wp_buffers[data_type],  # zero-copy alias
                     *list(self._data.output[data_type].shape[1:]),  # height, width, num_channels
-                    self._tiling_grid_shape()[0],  # num_tiles_x
+                    self._num_tiles_x,
                 ],
                 device=self.device,
             )
 
-            # alias rgb as first 3 channels of rgba
-            if data_type == "rgba" and "rgb" in self.cfg.data_types:
-                self._data.output["rgb"] = self._data.output["rgba"][..., :3]
-
             # NOTE: The `distance_to_camera` annotator returns the distance to the camera optical center. However,
             #       the replicator depth clipping is applied w.r.t. to the image plane which may result in values
             #       larger than the clipping range in the output. We apply an additional clipping to ensure values
@@ -325,6 +321,8 @@ class TiledCamera(Camera):
 
     def _create_buffers(self):
         """Create buffers for storing data."""
+        # cache the tiling grid width since it is fixed after initialization
+        self._num_tiles_x = self._tiling_grid_shape()[0]
         # create the data object
         # -- pose of the cameras
         self._data.pos_w = torch.zeros((self._view.count, 3), device=self._device)
@@ -339,61 +337,69 @@ class TiledCamera(Camera):
         if "rgba" in self.cfg.data_types or "rgb" in self.cfg.data_types:
             data_dict["rgba"] = torch.zeros(
                 (self._view.count, self.cfg.height, self.cfg.width, 4), device=self.device, dtype=torch.uint8
-            ).contiguous()
+            )
         if "rgb" in self.cfg.data_types:
             # RGB is the first 3 channels of RGBA
             data_dict["rgb"] = data_dict["rgba"][..., :3]
         if "distance_to_image_plane" in self.cfg.data_types:
             data_dict["distance_to_image_plane"] = torch.zeros(
                 (self._view.count, self.cfg.height, self.cfg.width, 1), device=self.device, dtype=torch.float32
-            ).contiguous()
+            )
         if "depth" in self.cfg.data_types:
             data_dict["depth"] = torch.zeros(
                 (self._view.count, self.cfg.height, self.cfg.width, 1), device=self.device, dtype=torch.float32
-            ).contiguous()
+            )
         if "distance_to_camera" in self.cfg.data_types:
             data_dict["distance_to_camera"] = torch.zeros(
                 (self._view.count, self.cfg.height, self.cfg.width, 1), device=self.device, dtype=torch.float32
-            ).contiguous()
+            )
         if "normals" in self.cfg.data_types:
             data_dict["normals"] = torch.zeros(
                 (self._view.count, self.cfg.height, self.cfg.width, 3), device=self.device, dtype=torch.float32
-            ).contiguous()
+            )
         if "motion_vectors" in self.cfg.data_types:
             data_dict["motion_vectors"] = torch.zeros(
                 (self._view.count, self.cfg.height, self.cfg.width, 2), device=self.device, dtype=torch.float32
-            ).contiguous()
+            )
         if "semantic_segmentation" in self.cfg.data_types:
             if self.cfg.colorize_semantic_segmentation:
                 data_dict["semantic_segmentation"] = torch.zeros(
                     (self._view.count, self.cfg.height, self.cfg.width, 4), device=self.device, dtype=torch.uint8
-                ).contiguous()
+                )
             else:
                 data_dict["semantic_segmentation"] = torch.zeros(
                     (self._view.count, self.cfg.height, self.cfg.width, 1), device=self.device, dtype=torch.int32
-                ).contiguous()
+                )
         if "instance_segmentation_fast" in self.cfg.data_types:
             if self.cfg.colorize_instance_segmentation:
                 data_dict["instance_segmentation_fast"] = torch.zeros(
                     (self._view.count, self.cfg.height, self.cfg.width, 4), device=self.device, dtype=torch.uint8
-                ).contiguous()
+                )
             else:
                 data_dict["instance_segmentation_fast"] = torch.zeros(
                     (self._view.count, self.cfg.height, self.cfg.width, 1), device=self.device, dtype=torch.int32
-                ).contiguous()
+                )
         if "instance_id_segmentation_fast" in self.cfg.data_types:
             if self.cfg.colorize_instance_id_segmentation:
                 data_dict["instance_id_segmentation_fast"] = torch.zeros(
                     (self._view.count, self.cfg.height, self.cfg.width, 4), device=self.device, dtype=torch.uint8
-                ).contiguous()
+                )
             else:
                 data_dict["instance_id_segmentation_fast"] = torch.zeros(
                     (self._view.count, self.cfg.height, self.cfg.width, 1), device=self.device, dtype=torch.int32
-                ).contiguous()
+                )
 
         self._data.output = data_dict
         self._data.info = dict()
 
+        # cache zero-copy warp aliases of the output buffers used by the reshape kernel
+        # note: the output tensors are persistent so re-wrapping them every frame is redundant.
+        #   the "rgb" entry is skipped since it is a view into the "rgba" buffer and never
+        #   written to directly by the kernel.
+        self._output_wp_buffers = {
+            data_type: wp.from_torch(tensor) for data_type, tensor in data_dict.items() if data_type != "rgb"
+        }
+
     def _tiled_image_shape(self) -> tuple[int, int]:
         """Returns a tuple containing the dimension of the tiled image."""
         cols, rows = self._tiling_grid_shape()
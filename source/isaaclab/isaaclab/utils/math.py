@@ -177,18 +177,22 @@ def matrix_from_quat(quaternions: torch.Tensor) -> torch.Tensor:
     r, i, j, k = torch.unbind(quaternions, -1)
     # pyre-fixme[58]: `/` is not supported for operand types `float` and `Tensor`.
     two_s = 2.0 / (quaternions * quaternions).sum(-1)
+    # compute the quaternion products once since each appears in two matrix entries
+    ii, jj, kk = i * i, j * j, k * k
+    ij, ik, jk = i * j, i * k, j * k
+    ri, rj, rk = r * i, r * j, r * k
 
     o = torch.stack(
         (
-            1 - two_s * (j * j + k * k),
-            two_s * (i * j - k * r),
-            two_s * (i * k + j * r),
-            two_s * (i * j + k * r),
-            1 - two_s * (i * i + k * k),
-            two_s * (j * k - i * r),
-            two_s * (i * k - j * r),
-            two_s * (j * k + i * r),
-            1 - two_s * (i * i + j * j),
+            1 - two_s * (jj + kk),
+            two_s * (ij - rk),
+            two_s * (ik + rj),
+            two_s * (ij + rk),
+            1 - two_s * (ii + kk),
+            two_s * (jk - ri),
+            two_s * (ik - rj),
+            two_s * (jk + ri),
+            1 - two_s * (ii + jj),
         ),
         -1,
     )
@@ -1513,6 +1517,28 @@ def sample_cylinder(
 Orientation Conversions
 """
 
+_WORLD_TO_OPENGL_ROT_CACHE: dict[torch.device, torch.Tensor] = {}
+"""Per-device cache of the fixed world-to-opengl rotation matrix used for camera convention conversions."""
+
+
+def _world_to_opengl_rotation_matrix(device: torch.device) -> torch.Tensor:
+    """Returns the fixed rotation matrix from the world to the opengl camera convention.
+
+    The matrix is constant, so it is built once per device and cached to avoid re-creating
+    the euler-angle tensor and re-running the conversion on every call.
+
+    Args:
+        device: The device to place the rotation matrix on.
+
+    Returns:
+        The rotation matrix. Shape is (3, 3).
+    """
+    rot_mat = _WORLD_TO_OPENGL_ROT_CACHE.get(device)
+    if rot_mat is None:
+        rot_mat = matrix_from_euler(torch.tensor([math.pi / 2, -math.pi / 2, 0], device=device), "XYZ")
+        _WORLD_TO_OPENGL_ROT_CACHE[device] = rot_mat
+    return rot_mat
+
 
 def convert_camera_frame_orientation_convention(
     orientation: torch.Tensor,
@@ -1575,10 +1601,7 @@ def convert_camera_frame_orientation_convention(
     elif origin == "world":
         # convert from world (x forward and z up) to opengl convention
         rotm = matrix_from_quat(orientation)
-        rotm = torch.matmul(
-            rotm,
-            matrix_from_euler(torch.tensor([math.pi / 2, -math.pi / 2, 0], device=orientation.device), "XYZ"),
-        )
+        rotm = torch.matmul(rotm, _world_to_opengl_rotation_matrix(orientation.device))
         # convert to isaac-sim convention
         quat_gl = quat_from_matrix(rotm)
     else:
@@ -1594,10 +1617,7 @@ def convert_camera_frame_orientation_convention(
     elif target == "world":
         # convert from opengl to world (x forward and z up) convention
         rotm = matrix_from_quat(quat_gl)
-        rotm = torch.matmul(
-            rotm,
-            matrix_from_euler(torch.tensor([math.pi / 2, -math.pi / 2, 0], device=orientation.device), "XYZ").T,
-        )
+        rotm = torch.matmul(rotm, _world_to_opengl_rotation_matrix(orientation.device).T)
         return quat_from_matrix(rotm)
     else:
         return quat_gl.clone()
@@ -16,35 +16,102 @@ from typing import TYPE_CHECKING
 import torch
 
 from isaaclab.assets import Articulation, RigidObject
-from isaaclab.managers import SceneEntityCfg
+from isaaclab.managers import ManagerTermBase, SceneEntityCfg
 
 if TYPE_CHECKING:
     from isaaclab.envs import ManagerBasedRLEnv
+    from isaaclab.managers import TerminationTermCfg
 
 
-def out_of_bound(
-    env: ManagerBasedRLEnv,
-    asset_cfg: SceneEntityCfg = SceneEntityCfg("object"),
-    in_bound_range: dict[str, tuple[float, float]] = {},
+@torch.jit.script
+def _out_of_bound_fused(
+    pos_w: torch.Tensor, origins: torch.Tensor, lower: torch.Tensor, upper: torch.Tensor
 ) -> torch.Tensor:
+    """Checks element-wise whether the environment-local positions fall outside the given bounds."""
+    pos = pos_w - origins
+    return ((pos < lower) | (pos > upper)).any(dim=1)
+
+
+@torch.jit.script
+def _abnormal_state_fused(joint_vel: torch.Tensor, threshold: torch.Tensor) -> torch.Tensor:
+    """Checks row-wise whether any joint velocity magnitude exceeds the threshold."""
+    return (joint_vel.abs() > threshold).any(dim=1)
+
+
+class out_of_bound(ManagerTermBase):
     """Termination condition for the object falls out of bound.
 
-    Args:
-        env: The environment.
-        asset_cfg: The object configuration. Defaults to SceneEntityCfg("object").
-        in_bound_range: The range in x, y, z such that the object is considered in range
+    The bound ranges are constant after initialization, so they are parsed and moved to the device
+    once here instead of on every environment step. The comparison against the bounds runs through
+    a scripted helper so the element-wise checks and the reduction fuse into a single pass.
     """
-    object: RigidObject = env.scene[asset_cfg.name]
-    range_list = [in_bound_range.get(key, (0.0, 0.0)) for key in ["x", "y", "z"]]
-    ranges = torch.tensor(range_list, device=env.device)
 
-    object_pos_local = object.data.root_pos_w - env.scene.env_origins
-    outside_bounds = ((object_pos_local < ranges[:, 0]) | (object_pos_local > ranges[:, 1])).any(dim=1)
-    return outside_bounds
+    def __init__(self, cfg: TerminationTermCfg, env: ManagerBasedRLEnv):
+        """Initialize the term.
+
+        Args:
+            cfg: The termination term configuration.
+            env: The environment.
+        """
+        super().__init__(cfg, env)
+        # extract the used quantities (to enable type-hinting)
+        asset_cfg: SceneEntityCfg = cfg.params.get("asset_cfg", SceneEntityCfg("object"))
+        self._object: RigidObject = env.scene[asset_cfg.name]
+        # parse the in-bound range once into lower/upper bound tensors
+        # note: the six floats are flattened into one tuple so a single host-to-device copy suffices.
+        in_bound_range: dict[str, tuple[float, float]] = cfg.params.get("in_bound_range", {})
+        bounds = tuple(value for key in ("x", "y", "z") for value in in_bound_range.get(key, (0.0, 0.0)))
+        ranges = torch.tensor(bounds, device=env.device).view(3, 2)
+        self._lower_bound = ranges[:, 0].contiguous()
+        self._upper_bound = ranges[:, 1].contiguous()
+        # cache the environment origins since the tensor is allocated once at scene setup
+        self._env_origins = env.scene.env_origins
+
+    def __call__(
+        self,
+        env: ManagerBasedRLEnv,
+        asset_cfg: SceneEntityCfg = SceneEntityCfg("object"),
+        in_bound_range: dict[str, tuple[float, float]] = {},
+    ) -> torch.Tensor:
+        """Termination condition for the object falls out of bound.
+
+        Args:
+            env: The environment.
+            asset_cfg: The object configuration. Defaults to SceneEntityCfg("object").
+            in_bound_range: The range in x, y, z such that the object is considered in range
+        """
+        return _out_of_bound_fused(
+            self._object.data.root_pos_w, self._env_origins, self._lower_bound, self._upper_bound
+        )
 
 
-def abnormal_robot_state(env: ManagerBasedRLEnv, asset_cfg: SceneEntityCfg = SceneEntityCfg("robot")) -> torch.Tensor:
+class abnormal_robot_state(ManagerTermBase):
     """Terminating environment when violation of velocity limits detects, this usually indicates unstable physics caused
-    by very bad, or aggressive action"""
-    robot: Articulation = env.scene[asset_cfg.name]
-    return (robot.data.joint_vel.abs() > (robot.data.joint_vel_limits * 2)).any(dim=1)
+    by very bad, or aggressive action.
+
+    The robot handle and the velocity-limit threshold are resolved once at initialization since the
+    limits do not change across steps.
+    """
+
+    def __init__(self, cfg: TerminationTermCfg, env: ManagerBasedRLEnv):
+        """Initialize the term.
+
+        Args:
+            cfg: The termination term configuration.
+            env: The environment.
+        """
+        super().__init__(cfg, env)
+        # extract the used quantities (to enable type-hinting)
+        asset_cfg: SceneEntityCfg = cfg.params.get("asset_cfg", SceneEntityCfg("robot"))
+        self._robot: Articulation = env.scene[asset_cfg.name]
+        # precompute the velocity threshold since the joint limits are fixed
+        self._vel_threshold = (self._robot.data.joint_vel_limits * 2).contiguous()
+
+    def __call__(self, env: ManagerBasedRLEnv, asset_cfg: SceneEntityCfg = SceneEntityCfg("robot")) -> torch.Tensor:
+        """Check for violation of the joint velocity limits.
+
+        Args:
+            env: The environment.
+            asset_cfg: The robot configuration. Defaults to SceneEntityCfg("robot").
+        """
+        return _abnormal_state_fused(self._robot.data.joint_vel, self._vel_threshold)